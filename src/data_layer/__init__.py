@@ -3,12 +3,13 @@ Data layer utilities for ingestion, resampling, and enrichment.
 """
 
 from .fetch_raw_data import load_ohlcv_file, load_and_resample
-from .resample_timeframes import resample_ohlcv
+from .resample_timeframes import resample_ohlcv, resample_ohlcv_timeframes
 from .enrich_with_sessions_and_events import enrich_with_time_features
 
 __all__ = [
     "load_ohlcv_file",
     "load_and_resample",
     "resample_ohlcv",
+    "resample_ohlcv_timeframes",
     "enrich_with_time_features",
 ]
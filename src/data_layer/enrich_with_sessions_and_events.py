@@ -3,9 +3,50 @@ from __future__ import annotations
 import calendar
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 
+# (label, start_hour_utc, end_hour_utc) - half-open [start, end) windows
+_SESSION_WINDOWS = (
+    ("Asia", 0, 7),
+    ("London", 7, 13),
+    ("NewYork", 13, 22),
+    ("AfterHours", 22, 24),
+)
+
+_SESSION_CATEGORIES = [label for label, _, _ in _SESSION_WINDOWS]
+
+_NS_PER_HOUR = 3_600_000_000_000
+
+# Start hour of every window after the first, computed once at import.
+# Windows are contiguous, so these are the bin edges between sessions.
+_SESSION_EDGES = np.array([start for _, start, _ in _SESSION_WINDOWS[1:]])
+_DAY_NAMES = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+_MONTH_NAMES = [
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+]
+
+
 def _get_session(hour_utc: int) -> str:
     """
     Simple session mapping based on UTC hour.
@@ -22,6 +63,40 @@ def _get_session(hour_utc: int) -> str:
     return "AfterHours"
 
 
+def _session_codes(hour_utc: np.ndarray) -> np.ndarray:
+    """
+    Vectorized equivalent of `_get_session` over an array of UTC hours.
+
+    Returns positions into `_SESSION_CATEGORIES` (categorical codes).
+    """
+    # Binary search over the window edges maps every hour in a single pass
+    return np.searchsorted(_SESSION_EDGES, hour_utc, side="right").astype(np.int8)
+
+
+def _utc_hours(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    UTC hour (0-23) of every timestamp, or wall-clock hour for a naive index.
+
+    Reads the int64 view directly (tz-aware indexes store UTC), after
+    normalizing to nanoseconds: pandas 2 indexes may be in s/ms/us units.
+    """
+    return (index.as_unit("ns").asi8 // _NS_PER_HOUR) % 24
+
+
+def _int8_field(values: pd.Index, nat: np.ndarray) -> np.ndarray:
+    """
+    int8 array of a datetime field; NaT rows (NaN) are filled with 1.
+    """
+    return np.where(nat, 1, values.to_numpy()).astype(np.int8)
+
+
+def _masked_codes(codes: np.ndarray, nat: np.ndarray) -> np.ndarray:
+    """
+    Categorical codes with NaT rows set to -1 (missing).
+    """
+    return np.where(nat, -1, codes).astype(np.int8)
+
+
 def enrich_with_time_features(
     df: pd.DataFrame,
     *,
@@ -31,12 +106,15 @@ def enrich_with_time_features(
     Add time-based features to an OHLCV DataFrame.
 
     Features:
-    - session: Asia/London/NewYork/AfterHours
+    - session: Asia/London/NewYork/AfterHours (categorical)
     - day_of_week: 0-6 (Mon=0)
-    - day_name: string name
+    - day_name: string name (categorical)
     - week_of_month: 1-5
     - month: 1-12
-    - month_name: string name
+    - month_name: string name (categorical)
+
+    Rows with a NaT timestamp get missing values; the integer columns are
+    then nullable Int8 instead of int8.
 
     Parameters
     ----------
@@ -50,30 +128,54 @@ def enrich_with_time_features(
     -------
     pd.DataFrame
         Original columns + new feature columns.
+        The original columns are not copied: without copy-on-write they
+        are views of `df`, so do not modify them in place (take a
+        `.copy()` first if needed).
     """
     if not isinstance(df.index, pd.DatetimeIndex):
         raise TypeError("DataFrame index must be a DatetimeIndex")
 
     idx = df.index
     if tz is not None:
-        # Work on a converted copy of the index for feature extraction
-        idx = idx.tz_convert(tz)
-
-    # Basic date components
-    day_of_week = idx.dayofweek
-    day_name = idx.day_name()
-    month = idx.month
-    month_name = idx.month_name()
+        # Work on a converted copy of the index for feature extraction;
+        # naive indexes are treated as UTC
+        if idx.tz is None:
+            idx = idx.tz_localize("UTC")
+        if str(idx.tz) != tz:
+            idx = idx.tz_convert(tz)
+
+    # NaT rows get missing features (code -1 / <NA>), not made-up dates
+    nat = np.asarray(idx.isna())
+
+    # Basic date components (small ranges, stored as int8).
+    # Names reuse the integer fields as categorical codes instead of
+    # running the per-element day_name()/month_name() lookups.
+    day_of_week = _int8_field(idx.dayofweek, nat)
+    day_name = pd.Categorical.from_codes(
+        _masked_codes(day_of_week, nat), categories=_DAY_NAMES
+    )
+    month = _int8_field(idx.month, nat)
+    month_name = pd.Categorical.from_codes(
+        _masked_codes(month - 1, nat), categories=_MONTH_NAMES
+    )
 
     # Week of month: 1..5
     # e.g. 1–7 -> 1, 8–14 -> 2, etc.
-    week_of_month = ((idx.day - 1) // 7) + 1
-
-    # Session by UTC hour (using original index)
-    hour_utc = df.index.tz_convert("UTC").hour
-    session = [ _get_session(h) for h in hour_utc ]
-
-    enriched = df.copy()
+    week_of_month = (_int8_field(idx.day, nat) - 1) // 7 + 1
+
+    # Session by UTC hour of the original index, without any tz conversion
+    session = pd.Categorical.from_codes(
+        _masked_codes(_session_codes(_utc_hours(df.index)), nat),
+        categories=_SESSION_CATEGORIES,
+    )
+    if nat.any():
+        # Nullable integers so NaT rows stay <NA> instead of a fill value
+        day_of_week = pd.arrays.IntegerArray(day_of_week, nat.copy())
+        month = pd.arrays.IntegerArray(month, nat.copy())
+        week_of_month = pd.arrays.IntegerArray(week_of_month, nat.copy())
+
+    # Shallow copy: the OHLCV blocks are shared, only new columns are added
+    enriched = df.copy(deep=False)
     enriched["session"] = session
     enriched["day_of_week"] = day_of_week
     enriched["day_name"] = day_name
@@ -1,16 +1,79 @@
 from __future__ import annotations
 
+import functools
+import importlib.util
 import os
 from pathlib import Path
 from typing import Literal, Optional
 
-import nasdaqdatalink
+import numpy as np
 import pandas as pd
 
 
 Timeframe = Literal["1m", "5m", "15m", "1H", "4H", "1D", "1W"]
 
+_DEFAULT_TIMEFRAMES: tuple[Timeframe, ...] = ("1m", "5m", "15m", "1H", "4H", "1D", "1W")
 
+_OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# Short vendor column names mapped to the normalized OHLCV names
+_COLUMN_ALIASES = {
+    "o": "open",
+    "h": "high",
+    "l": "low",
+    "c": "close",
+    "v": "volume",
+}
+
+# Price columns (normalized and aliased) parsed straight to float64
+_PRICE_DTYPES = {
+    name: "float64"
+    for name in ["open", "high", "low", "close", "o", "h", "l", "c"]
+}
+
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def _read_raw_frame(path: Path, time_column: str) -> pd.DataFrame:
+    """
+    Read only the time and OHLCV (or aliased) columns from a CSV/Parquet file.
+
+    CSV files go through the multithreaded PyArrow parser when pyarrow is
+    installed, otherwise through pandas' C parser.
+    """
+    wanted = {time_column, *_OHLCV_COLUMNS, *_COLUMN_ALIASES}
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        if not _HAS_PYARROW:
+            return pd.read_csv(
+                path,
+                usecols=lambda col: col in wanted,
+                dtype=_PRICE_DTYPES,
+            )
+        # The pyarrow engine needs an explicit column list
+        header = pd.read_csv(path, nrows=0).columns
+        usecols = [c for c in header if c in wanted]
+        return pd.read_csv(
+            path,
+            engine="pyarrow",
+            usecols=usecols,
+            dtype={c: t for c, t in _PRICE_DTYPES.items() if c in usecols},
+        )
+
+    if suffix in {".parquet", ".pq"}:
+        if not _HAS_PYARROW:
+            return pd.read_parquet(path)
+        import pyarrow.parquet as pq
+
+        # Schema comes from the file footer, no column data is read
+        columns = [c for c in pq.read_schema(path).names if c in wanted]
+        return pd.read_parquet(path, columns=columns)
+
+    raise ValueError(f"Unsupported file extension: {path.suffix}")
+
+
+@functools.lru_cache(maxsize=32)
 def _normalize_timeframe(tf: str) -> str:
     """
     Convert human-readable timeframe to pandas offset alias.
@@ -36,6 +99,7 @@ def load_ohlcv_file(
     *,
     time_column: str = "timestamp",
     tz: Optional[str] = "UTC",
+    downcast: bool = True,
 ) -> pd.DataFrame:
     """
     Load OHLCV data from a CSV or Parquet file into a normalized DataFrame.
@@ -55,6 +119,15 @@ def load_ohlcv_file(
     tz:
         Timezone to localize the DateTimeIndex to (default: UTC).
         If None, no tz-localization will be applied.
+    downcast:
+        If True (default), store prices as float32 and volume as the
+        smallest integer type that holds it. The narrower columns halve
+        the memory traffic of downstream resampling/enrichment.
+        This is lossy for arbitrary prices: only raw NQ prices (quarter
+        ticks, below ~4M) are exact in float32. Back-adjusted continuous
+        series (e.g. 15000.37) get rounded, which shifts FVG top/width and
+        can turn strict low > high comparisons into ties; pass
+        downcast=False for such data.
 
     Returns
     -------
@@ -62,24 +135,21 @@ def load_ohlcv_file(
         Index: DatetimeIndex (sorted ascending)
         Columns: ["open", "high", "low", "close", "volume"]
     """
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Data file not found: {path}")
-
-    if path.suffix.lower() == ".csv":
-        df = pd.read_csv(path)
-    elif path.suffix.lower() in {".parquet", ".pq"}:
-        df = pd.read_parquet(path)
-    else:
-        raise ValueError(f"Unsupported file extension: {path.suffix}")
+    # No exists() pre-check: the readers raise FileNotFoundError themselves
+    df = _read_raw_frame(Path(path), time_column)
 
     if time_column not in df.columns:
         raise KeyError(f"Expected time column '{time_column}' in data file")
 
-    # Convert timestamp to datetime
-    df[time_column] = pd.to_datetime(df[time_column], utc=True, errors="coerce")
+    # Convert timestamp to datetime. The pyarrow parser and Parquet files
+    # can yield s/ms/us resolutions; keep the index in ns for every reader.
+    df[time_column] = pd.to_datetime(
+        df[time_column], utc=True, errors="coerce"
+    ).dt.as_unit("ns")
     df = df.dropna(subset=[time_column]).copy()
-    df = df.sort_values(time_column)
+    # Exports are normally chronological already; only sort when they are not
+    if not df[time_column].is_monotonic_increasing:
+        df = df.sort_values(time_column)
 
     df = df.set_index(time_column)
 
@@ -91,21 +161,18 @@ def load_ohlcv_file(
             df.index = df.index.tz_convert(tz)
 
     # Normalize columns
-    rename_map = {
-        "o": "open",
-        "h": "high",
-        "l": "low",
-        "c": "close",
-        "v": "volume",
-    }
-    df = df.rename(columns=rename_map)
+    df = df.rename(columns=_COLUMN_ALIASES)
 
-    required_cols = ["open", "high", "low", "close", "volume"]
-    missing = [c for c in required_cols if c not in df.columns]
+    missing = [c for c in _OHLCV_COLUMNS if c not in df.columns]
     if missing:
         raise KeyError(f"Missing required OHLCV columns: {missing}")
 
-    return df[required_cols]
+    df = df[_OHLCV_COLUMNS]
+    if downcast:
+        df = df.astype({c: np.float32 for c in ["open", "high", "low", "close"]})
+        df["volume"] = pd.to_numeric(df["volume"], downcast="integer")
+
+    return df
 
 
 def load_and_resample(
@@ -132,16 +199,15 @@ def load_and_resample(
     dict[str, pd.DataFrame]
         Keys are timeframe strings, values are OHLCV DataFrames.
     """
-    from .resample_timeframes import resample_ohlcv  # local import
+    from .resample_timeframes import resample_ohlcv_timeframes  # local import
 
     if timeframes is None:
-        timeframes = ["1m", "5m", "15m", "1H", "4H", "1D", "1W"]
+        timeframes = list(_DEFAULT_TIMEFRAMES)
 
     base_df = load_ohlcv_file(path, tz=tz)
-    return {
-        tf: resample_ohlcv(base_df, _normalize_timeframe(tf))
-        for tf in timeframes
-    }
+    rules = {tf: _normalize_timeframe(tf) for tf in timeframes}
+    resampled = resample_ohlcv_timeframes(base_df, list(rules.values()))
+    return {tf: resampled[rule] for tf, rule in rules.items()}
 
 
 def get_nasdaq_api_key(env_var: str = "NASDAQ_API_KEY") -> str:
@@ -171,6 +237,20 @@ def get_nasdaq_api_key(env_var: str = "NASDAQ_API_KEY") -> str:
     return key
 
 
+@functools.lru_cache(maxsize=1)
+def _configured_client():
+    """
+    Import nasdaqdatalink and set its API key once per process.
+
+    Imported here so file-based loading does not pay for the Nasdaq client.
+    A missing key raises and is not cached, so a later call can retry.
+    """
+    import nasdaqdatalink
+
+    nasdaqdatalink.ApiConfig.api_key = get_nasdaq_api_key()
+    return nasdaqdatalink
+
+
 def fetch_nq_from_nasdaq(
     dataset_code: str,
     *,
@@ -203,8 +283,7 @@ def fetch_nq_from_nasdaq(
     pd.DataFrame
         DatetimeIndex, columns: ["open", "high", "low", "close", "volume"]
     """
-    api_key = get_nasdaq_api_key()
-    nasdaqdatalink.ApiConfig.api_key = api_key
+    nasdaqdatalink = _configured_client()
 
     raw = nasdaqdatalink.get(
         dataset_code,
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Sequence
+
 import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import BaseOffset
+
+
+_DAY_NS = 86_400_000_000_000
 
 
 def resample_ohlcv(df: pd.DataFrame, rule: str) -> pd.DataFrame:
@@ -23,15 +32,123 @@ def resample_ohlcv(df: pd.DataFrame, rule: str) -> pd.DataFrame:
     if not isinstance(df.index, pd.DatetimeIndex):
         raise TypeError("DataFrame index must be a DatetimeIndex")
 
-    ohlc_dict = {
-        "open": "first",
-        "high": "max",
-        "low": "min",
-        "close": "last",
-        "volume": "sum",
-    }
-
-    resampled = df.resample(rule, label="right", closed="right").agg(ohlc_dict)
-    resampled = resampled.dropna(subset=["open", "high", "low", "close"])
+    # One set of bins, then a direct Cython reduction per column
+    bars = df.resample(rule, label="right", closed="right")
+    resampled = pd.DataFrame(
+        {
+            "open": bars["open"].first(),
+            "high": bars["high"].max(),
+            "low": bars["low"].min(),
+            "close": bars["close"].last(),
+            "volume": bars["volume"].sum(),
+        }
+    )
+    # Empty bins have no first value, so a NaN open marks them all
+    resampled = resampled.dropna(subset=["open"])
 
     return resampled
+
+
+def _fixed_nanos(offset: BaseOffset) -> Optional[int]:
+    try:
+        return offset.nanos
+    except ValueError:
+        # Non-fixed (calendar) frequency, e.g. weekly or monthly
+        return None
+
+
+def _span_nanos(offset: BaseOffset) -> int:
+    """
+    Approximate bar length, used only to order timeframes small -> large.
+    """
+    ref = pd.Timestamp("2000-01-03")
+    return (ref + offset - ref).value
+
+
+def _can_cascade(parent: BaseOffset, child: BaseOffset) -> bool:
+    """
+    True if every `parent` bar falls entirely inside a single `child` bar,
+    so `child` can be aggregated from `parent` bars instead of raw data.
+
+    Only fixed-length timeframes qualify: the child must be a multiple of
+    the parent and divide a day, so both grids line up on midnight. Calendar
+    periods (weeks, months) bin whole calendar days, which right-closed
+    intraday bars straddle, so they are always built from the raw data.
+    """
+    parent_ns = _fixed_nanos(parent)
+    child_ns = _fixed_nanos(child)
+    if parent_ns is None or child_ns is None:
+        return False
+    return child_ns % parent_ns == 0 and _DAY_NS % child_ns == 0
+
+
+def _resample_from(
+    df: pd.DataFrame,
+    parent: Optional[Future],
+    rule: str,
+) -> pd.DataFrame:
+    source = df if parent is None else parent.result()
+    return resample_ohlcv(source, rule)
+
+
+def resample_ohlcv_timeframes(
+    df: pd.DataFrame,
+    rules: Sequence[str],
+    *,
+    base_rule: Optional[str] = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Resample OHLCV data to several timeframes at once.
+
+    Timeframes are built from the coarsest compatible timeframe already
+    computed (e.g. 15T from 5T, 1D from 4H) rather than from `df` each time.
+    OHLCV aggregation (first/max/min/last/sum) is associative, so the result
+    matches resampling `df` directly. Cascading is only used for UTC or naive
+    indexes, where bar boundaries are not shifted by DST.
+
+    Independent timeframes run concurrently on a thread pool (pandas releases
+    the GIL in its aggregation kernels); a cascaded timeframe waits only for
+    the timeframe it is built from.
+
+    Parameters
+    ----------
+    df:
+        OHLCV DataFrame with DatetimeIndex.
+    rules:
+        Pandas offset aliases, e.g. ["5T", "15T", "1H", "1D"].
+    base_rule:
+        Optional alias describing the timeframe of `df` itself (e.g. "1min").
+        That rule is returned as `df` unchanged instead of being resampled.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        Keys are the requested rules, values are resampled OHLCV DataFrames.
+    """
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise TypeError("DataFrame index must be a DatetimeIndex")
+
+    offsets = {rule: to_offset(rule) for rule in rules}
+    cascade = df.index.tz is None or str(df.index.tz) == "UTC"
+
+    jobs: dict[str, Future] = {}
+    max_workers = max(1, min(len(offsets), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Parents are always submitted before their children, so a child
+        # never blocks a worker on a job that has not started yet.
+        for rule in sorted(offsets, key=lambda r: _span_nanos(offsets[r])):
+            if rule == base_rule:
+                jobs[rule] = Future()
+                jobs[rule].set_result(df)
+                continue
+
+            parent = None
+            if cascade:
+                # `jobs` is filled in ascending order, so the last match is the coarsest
+                for candidate in jobs:
+                    if _can_cascade(offsets[candidate], offsets[rule]):
+                        parent = jobs[candidate]
+
+            jobs[rule] = pool.submit(_resample_from, df, parent, rule)
+
+    return {rule: jobs[rule].result() for rule in rules}
@@ -0,0 +1,62 @@
+"""
+Optional Numba kernels for the FVG detector.
+
+`scan_fvg` is None when numba is not installed; `fvg_detector` then falls
+back to its NumPy implementation.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional dependency
+    njit = None
+
+
+if njit is None:
+    scan_fvg = None
+else:
+
+    # No fastmath: it lets LLVM assume no NaNs, which would change the
+    # result of the gap comparisons on bars with missing prices.
+    @njit(cache=True, boundscheck=False)
+    def scan_fvg(highs, lows, min_width, out_idx, out_bull, out_top, out_bot):
+        """
+        Single pass 3-candle FVG scan writing into preallocated buffers
+        (sized 2 * (len(highs) - 2)). Returns the number of gaps written.
+        """
+        k = 0
+        for i in range(2, highs.shape[0]):
+            # bullish FVG: low[i] > high[i-2]
+            if lows[i] > highs[i - 2]:
+                if lows[i] - highs[i - 2] >= min_width:
+                    out_idx[k] = i
+                    out_bull[k] = True
+                    out_top[k] = lows[i]
+                    out_bot[k] = highs[i - 2]
+                    k += 1
+            # bearish FVG: high[i] < low[i-2]. Tested independently: a bar
+            # with low > high can open both gaps
+            if highs[i] < lows[i - 2]:
+                if lows[i - 2] - highs[i] >= min_width:
+                    out_idx[k] = i
+                    out_bull[k] = False
+                    out_top[k] = lows[i - 2]
+                    out_bot[k] = highs[i]
+                    k += 1
+        return k
+
+    # Compile (or load the cached build) at import, not on the first scan
+    _warm = np.zeros(3)
+    scan_fvg(
+        _warm,
+        _warm,
+        0.0,
+        np.empty(1, dtype=np.int64),
+        np.empty(1, dtype=np.bool_),
+        np.empty(1),
+        np.empty(1),
+    )
+    del _warm
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Literal, Optional, Sequence
 
+import numpy as np
 import pandas as pd
+from pandas.tseries.frequencies import to_offset
 
-from src.data_layer.resample_timeframes import resample_ohlcv
+from src.data_layer.resample_timeframes import resample_ohlcv_timeframes
+from src.known_patterns._fvg_kernels import scan_fvg as _scan_fvg_kernel
 
 
 Direction = Literal["bull", "bear"]
@@ -59,6 +63,30 @@ class FVG:
             "distance_to_price": self.distance_to_price,
         }
 
+    @classmethod
+    def from_row(cls, df: pd.DataFrame, i: int) -> "FVG":
+        """
+        Build an FVG from the i-th row (by position) of a patterns DataFrame,
+        as returned by `detect_fvg_frame` or `fvgs_to_frame`.
+        """
+        row = df.iloc[i]
+        return cls(
+            id=int(df.index[i]),
+            direction=row["direction"],
+            tf=row["tf"],
+            created_at=row["created_at"],
+            start_index=int(row["start_index"]),
+            end_index=int(row["end_index"]),
+            top=float(row["top"]),
+            bottom=float(row["bottom"]),
+            width=float(row["width"]),
+            is_filled=bool(row["is_filled"]),
+            filled_at=row["filled_at"],
+            session=row["session"],
+            part_of_day=row["part_of_day"],
+            distance_to_price=row["distance_to_price"],
+        )
+
 
 def _validate_ohlcv(df: pd.DataFrame) -> None:
     if not isinstance(df.index, pd.DatetimeIndex):
@@ -70,6 +98,87 @@ def _validate_ohlcv(df: pd.DataFrame) -> None:
         raise KeyError(f"Missing required OHLC columns: {missing}")
 
 
+def _price_array(df: pd.DataFrame, column: str) -> np.ndarray:
+    """
+    C-contiguous float64 array of a price column.
+
+    Zero-copy for float64 NumPy columns; float32, integer, nullable and
+    Arrow-backed columns are converted once (missing values -> NaN).
+    """
+    values = df[column].to_numpy(dtype=np.float64, copy=False, na_value=np.nan)
+    return np.ascontiguousarray(values)
+
+
+def _scan_fvg_numpy(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    min_width: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized 3-candle FVG scan over high/low arrays.
+
+    Returns (end_index, is_bull, top, bottom) arrays in chronological order,
+    where end_index is the position of the third candle.
+    """
+    # bullish FVG: low[i] > high[i-2] -> gap is [high[i-2], low[i]]
+    bull_top = lows[2:]
+    bull_bottom = highs[:-2]
+    bull_width = bull_top - bull_bottom
+
+    # bearish FVG: high[i] < low[i-2] -> gap is [high[i], low[i-2]]
+    bear_top = lows[:-2]
+    bear_bottom = highs[2:]
+    bear_width = bear_top - bear_bottom
+
+    # Both tests pack into one uint8 mask per bar: bit 0 bull, bit 1 bear
+    bull = (bull_width > 0) & (bull_width >= min_width)
+    bear = (bear_width > 0) & (bear_width >= min_width)
+    mask = bull.view(np.uint8) | (bear.view(np.uint8) << 1)
+
+    bull_pos = np.flatnonzero(mask & 1)
+    bear_pos = np.flatnonzero(mask & 2)
+
+    # A bar with low > high can open both gaps; the stable sort keeps
+    # chronological order with the bull gap first, as the scalar loop does
+    pos = np.concatenate([bull_pos, bear_pos])
+    is_bull = np.arange(len(pos)) < len(bull_pos)
+    top = np.concatenate([bull_top[bull_pos], bear_top[bear_pos]])
+    bottom = np.concatenate([bull_bottom[bull_pos], bear_bottom[bear_pos]])
+    if len(bull_pos) and len(bear_pos):
+        order = np.argsort(pos, kind="stable")
+        pos, is_bull, top, bottom = pos[order], is_bull[order], top[order], bottom[order]
+    top = top.astype(np.float64)
+    bottom = bottom.astype(np.float64)
+
+    return pos + 2, is_bull, top, bottom
+
+
+def _scan_fvg(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    min_width: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    3-candle FVG scan; same output as `_scan_fvg_numpy`.
+
+    Expects contiguous float64 arrays (see `_price_array`), the layout the
+    Numba kernel is warmed up for. Uses that kernel when numba is
+    installed, otherwise the NumPy implementation.
+    """
+    if _scan_fvg_kernel is None:
+        return _scan_fvg_numpy(highs, lows, min_width)
+
+    # Up to two gaps per bar from the third one on (both only if low > high)
+    n = 2 * max(len(highs) - 2, 0)
+    out_idx = np.empty(n, dtype=np.int64)
+    out_bull = np.empty(n, dtype=np.bool_)
+    out_top = np.empty(n, dtype=np.float64)
+    out_bot = np.empty(n, dtype=np.float64)
+    k = _scan_fvg_kernel(highs, lows, float(min_width), out_idx, out_bull, out_top, out_bot)
+
+    return out_idx[:k], out_bull[:k], out_top[:k], out_bot[:k]
+
+
 def detect_fvg(
     df: pd.DataFrame,
     *,
@@ -98,59 +207,94 @@ def detect_fvg(
     """
     _validate_ohlcv(df)
 
-    highs = df["high"].values
-    lows = df["low"].values
-    idx = df.index
-
-    fvgs: List[FVG] = []
-    next_id = 1
-
-    # 3-candle logic: use i-2 and i
-    # we start from i=2 so that i-2 >= 0
-    for i in range(2, len(df)):
-        # bullish FVG: low[i] > high[i-2]
-        if lows[i] > highs[i - 2]:
-            bottom = highs[i - 2]
-            top = lows[i]
-            width = float(top - bottom)
-            if width >= min_width:
-                fvgs.append(
-                    FVG(
-                        id=next_id,
-                        direction="bull",
-                        tf=tf,
-                        created_at=idx[i],
-                        start_index=i - 2,
-                        end_index=i,
-                        top=float(top),
-                        bottom=float(bottom),
-                        width=width,
-                    )
-                )
-                next_id += 1
-
-        # bearish FVG: high[i] < low[i-2]
-        if highs[i] < lows[i - 2]:
-            top = lows[i - 2]
-            bottom = highs[i]
-            width = float(top - bottom)
-            if width >= min_width:
-                fvgs.append(
-                    FVG(
-                        id=next_id,
-                        direction="bear",
-                        tf=tf,
-                        created_at=idx[i],
-                        start_index=i - 2,
-                        end_index=i,
-                        top=float(top),
-                        bottom=float(bottom),
-                        width=width,
-                    )
-                )
-                next_id += 1
-
-    return fvgs
+    highs = _price_array(df, "high")
+    lows = _price_array(df, "low")
+
+    end_index, is_bull, top, bottom = _scan_fvg(highs, lows, min_width)
+    rows = zip(
+        end_index.tolist(),
+        is_bull.tolist(),
+        df.index[end_index],
+        top.tolist(),
+        bottom.tolist(),
+    )
+
+    return [
+        FVG(
+            id=k + 1,
+            direction="bull" if bull else "bear",
+            tf=tf,
+            created_at=created_at,
+            start_index=i - 2,
+            end_index=i,
+            top=t,
+            bottom=b,
+            width=t - b,
+        )
+        for k, (i, bull, created_at, t, b) in enumerate(rows)
+    ]
+
+
+def detect_fvg_frame(
+    df: pd.DataFrame,
+    *,
+    tf: str = "",
+    min_width: float = 0.0,
+) -> pd.DataFrame:
+    """
+    Detect Fair Value Gaps on a single timeframe as a patterns DataFrame.
+
+    Columnar counterpart of `fvgs_to_frame(detect_fvg(...))`: the scan
+    arrays go straight into columns without creating FVG objects.
+    Use `FVG.from_row` for record-style access to single gaps.
+
+    Parameters
+    ----------
+    df:
+        OHLCV DataFrame with DatetimeIndex. Must contain:
+        ['open', 'high', 'low', 'close'].
+    tf:
+        Timeframe label stored in the 'tf' column.
+    min_width:
+        Minimum price width of the gap (top - bottom) to keep.
+
+    Returns
+    -------
+    pd.DataFrame
+        Same schema as `fvgs_to_frame`, ids 1..n in chronological order.
+    """
+    _validate_ohlcv(df)
+
+    end_index, is_bull, top, bottom = _scan_fvg(
+        _price_array(df, "high"), _price_array(df, "low"), min_width
+    )
+    n = len(end_index)
+    # Explicit object dtype so an empty result has the same schema
+    empty_col = np.full(n, None, dtype=object)
+
+    frame = pd.DataFrame(
+        {
+            "id": np.arange(1, n + 1),
+            "pattern_type": "FVG",
+            "direction": pd.Categorical.from_codes(
+                (~is_bull).astype(np.int8), categories=["bull", "bear"]
+            ),
+            "tf": pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[tf]),
+            "created_at": df.index[end_index],
+            "start_index": (end_index - 2).astype(np.int32),
+            "end_index": end_index.astype(np.int32),
+            "top": top.astype(np.float32),
+            "bottom": bottom.astype(np.float32),
+            "width": (top - bottom).astype(np.float32),
+            "price_range": pd.Series(list(zip(bottom.tolist(), top.tolist())), dtype=object),
+            "is_filled": np.zeros(n, dtype=bool),
+            "filled_at": empty_col,
+            "session": empty_col.copy(),
+            "part_of_day": empty_col.copy(),
+            "distance_to_price": empty_col.copy(),
+        }
+    )
+    return frame.set_index("id")
 
 
 def fvgs_to_frame(fvgs: List[FVG]) -> pd.DataFrame:
@@ -180,8 +324,32 @@ def fvgs_to_frame(fvgs: List[FVG]) -> pd.DataFrame:
         ]
         return pd.DataFrame(columns=cols).set_index("id")
 
-    records = [f.to_dict() for f in fvgs]
-    df = pd.DataFrame.from_records(records)
+    # Build columns directly (same schema as FVG.to_dict) instead of
+    # materializing one dict per gap and re-parsing the records.
+    # Low-cardinality labels are categorical, prices float32, bar positions int32.
+    n = len(fvgs)
+    df = pd.DataFrame(
+        {
+            "id": np.fromiter((f.id for f in fvgs), dtype=np.int64, count=n),
+            "pattern_type": "FVG",
+            "direction": pd.Categorical(
+                [f.direction for f in fvgs], categories=["bull", "bear"]
+            ),
+            "tf": pd.Categorical([f.tf for f in fvgs]),
+            "created_at": [f.created_at for f in fvgs],
+            "start_index": np.fromiter((f.start_index for f in fvgs), dtype=np.int32, count=n),
+            "end_index": np.fromiter((f.end_index for f in fvgs), dtype=np.int32, count=n),
+            "top": np.fromiter((f.top for f in fvgs), dtype=np.float32, count=n),
+            "bottom": np.fromiter((f.bottom for f in fvgs), dtype=np.float32, count=n),
+            "width": np.fromiter((f.width for f in fvgs), dtype=np.float32, count=n),
+            "price_range": [(f.bottom, f.top) for f in fvgs],
+            "is_filled": [f.is_filled for f in fvgs],
+            "filled_at": [f.filled_at for f in fvgs],
+            "session": [f.session for f in fvgs],
+            "part_of_day": [f.part_of_day for f in fvgs],
+            "distance_to_price": [f.distance_to_price for f in fvgs],
+        }
+    )
     df = df.set_index("id").sort_index()
     return df
 
@@ -191,18 +359,43 @@ def fvgs_to_frame(fvgs: List[FVG]) -> pd.DataFrame:
 # ===========================
 
 
+_TF_TO_RULE = {
+    "1m": "1min",
+    "5m": "5min",
+    "15m": "15min",
+    "30m": "30min",
+    "1H": "1h",
+    "4H": "4h",
+    "1D": "1D",
+    "1W": "1W",
+}
+
+
+@lru_cache(maxsize=64)
 def _normalize_tf_to_rule(tf: str) -> str:
     """
     Convert a human timeframe like '1m', '5m', '15m', '1H', '4H', '1D', '1W'
     to a pandas resample rule.
 
-    We prefer 'min' instead of deprecated 'T'.
+    We prefer 'min'/'h' instead of deprecated 'T'/'H'.
+
+    Raises
+    ------
+    ValueError
+        If the timeframe does not map to a valid pandas frequency.
     """
     tf = tf.strip()
-    if tf.endswith("m"):
-        # '1m' -> '1min'
-        return tf[:-1] + "min"
-    return tf
+    rule = _TF_TO_RULE.get(tf)
+    if rule is None:
+        # '2m' -> '2min'; anything else is passed to pandas as-is
+        rule = tf[:-1] + "min" if tf.endswith("m") else tf
+
+    try:
+        to_offset(rule)
+    except ValueError as exc:
+        raise ValueError(f"Unrecognized timeframe: {tf!r}") from exc
+
+    return rule
 
 
 def detect_fvg_for_timeframes(
@@ -221,50 +414,73 @@ def detect_fvg_for_timeframes(
     timeframes:
         List of timeframe labels like ["1m", "5m", "15m", "1H"].
     min_width:
-        Minimum width filter passed to `detect_fvg`.
+        Minimum width filter passed to `detect_fvg_frame`.
 
     Returns
     -------
     pd.DataFrame
         Unified DataFrame of all detected FVGs across timeframes.
     """
-    all_fvgs: list[FVG] = []
+    # Resample all timeframes at once; each is built from the coarsest
+    # compatible one already computed (1m -> 5m -> 15m -> 1H ...).
+    # The base frame is treated as 1m data and used as-is for "1min".
+    rules = {tf: _normalize_tf_to_rule(tf) for tf in timeframes}
+    frames = resample_ohlcv_timeframes(
+        base_df, list(rules.values()), base_rule="1min"
+    )
 
-    for tf in timeframes:
-        rule = _normalize_tf_to_rule(tf)
+    # Sequential on purpose: the scan is a small part of detect_fvg_frame,
+    # the rest (frame construction) is GIL-bound pandas work
+    per_tf = [
+        detect_fvg_frame(frames[rules[tf]], tf=tf, min_width=min_width)
+        for tf in timeframes
+    ]
 
-        # Resample if needed
-        if rule != "1min":
-            df_tf = resample_ohlcv(base_df, rule)
-        else:
-            df_tf = base_df
+    if not per_tf:
+        # No timeframes requested: empty result with the same dtypes
+        per_tf = [detect_fvg_frame(base_df.iloc[:0])]
+
+    df_fvgs = pd.concat(per_tf)
+    # Each frame carries its own single 'tf' category; merge them back
+    df_fvgs["tf"] = df_fvgs["tf"].astype(str).astype("category")
+    # Ids restart at 1 for every timeframe; renumber so they are unique
+    df_fvgs.index = pd.Index(np.arange(1, len(df_fvgs) + 1), name="id")
+
+    return df_fvgs
 
-        fvgs_tf = detect_fvg(df_tf, tf=tf, min_width=min_width)
-        all_fvgs.extend(fvgs_tf)
 
-    return fvgs_to_frame(all_fvgs)
+# Low-cardinality label columns that benefit from dictionary encoding
+_DICTIONARY_COLUMNS = ["pattern_type", "direction", "tf", "session", "part_of_day"]
 
 
 def save_fvgs_to_parquet(df_fvgs: pd.DataFrame, path: str | Path) -> None:
     """
-    Save FVG DataFrame to Parquet file.
+    Save FVG DataFrame to Parquet file (PyArrow, ZSTD, dictionary-encoded labels).
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    df_fvgs.to_parquet(path)
+    df_fvgs.to_parquet(
+        path,
+        engine="pyarrow",
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=[c for c in _DICTIONARY_COLUMNS if c in df_fvgs.columns],
+        row_group_size=65536,
+        index=True,
+    )
 
 
 def load_fvgs_from_parquet(path: str | Path) -> pd.DataFrame:
     """
     Load FVG DataFrame from Parquet file.
     """
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"FVG file not found: {path}")
-    return pd.read_parquet(path)
+    # No exists() pre-check: read_parquet raises FileNotFoundError itself.
+    # Categorical columns are restored from the pandas metadata in the file.
+    return pd.read_parquet(Path(path), engine="pyarrow")
 
 
 from src.data_layer.enrich_with_sessions_and_events import (
+    _utc_hours,
     enrich_with_time_features,
 )
 
@@ -281,6 +497,21 @@ def _classify_part_of_day(hour_utc: int) -> str:
     return "evening"
 
 
+_PART_OF_DAY_CATEGORIES = ["morning", "noon", "evening"]
+# np.digitize bucket ([0,6), [6,12), [12,18), [18,24)) -> category code
+_PART_OF_DAY_CODES = np.array([2, 0, 1, 2], dtype=np.int8)
+
+
+def _part_of_day(hour_utc: np.ndarray) -> pd.Categorical:
+    """
+    Vectorized `_classify_part_of_day` over an array of UTC hours.
+    """
+    buckets = np.digitize(hour_utc, [6, 12, 18])
+    return pd.Categorical.from_codes(
+        _PART_OF_DAY_CODES[buckets], categories=_PART_OF_DAY_CATEGORIES
+    )
+
+
 def enrich_fvgs_with_time_and_price(
     df_fvgs: pd.DataFrame,
     base_df: pd.DataFrame,
@@ -315,32 +546,50 @@ def enrich_fvgs_with_time_and_price(
     base_enriched = enrich_with_time_features(base_df, tz=tz)
 
     # מייצרים טבלה עם session וחלקי יום לפי created_at
-    meta = base_enriched.copy()
-    meta["hour_utc"] = meta.index.tz_convert("UTC").hour
-    meta["part_of_day"] = meta["hour_utc"].apply(_classify_part_of_day)
-
-    # נצריך רק עמודות רלוונטיות
-    meta_cols = meta[["session", "part_of_day"]]
+    # (רק שתי העמודות הרלוונטיות, בלי להעתיק את עמודות ה-OHLCV)
+    # UTC hour from the int64 view of the index: no tz_convert, no new index
+    meta_cols = pd.DataFrame(
+        {
+            "session": base_enriched["session"].values,
+            "part_of_day": _part_of_day(_utc_hours(base_enriched.index)),
+        },
+        index=base_enriched.index,
+    )
+
+    # מצמידים לפי created_at: lookup ישיר באינדקס הממוין, בלי לבנות תוצאת join.
+    # A unique index is required for the lookup; duplicate bars keep the first.
+    if not meta_cols.index.is_unique:
+        meta_cols = meta_cols[~meta_cols.index.duplicated()]
+    matched = meta_cols.reindex(df_fvgs["created_at"])
 
-    # מצמידים לפי created_at
     df = df_fvgs.copy()
-    df = df.join(meta_cols, on="created_at", how="left")
+    df["session"] = matched["session"].values
+    df["part_of_day"] = matched["part_of_day"].values
 
     # קביעת מחיר אחרון
     if last_price is None and not base_df.empty:
         last_price = float(base_df["close"].iloc[-1])
 
     if last_price is not None:
-        def _distance(row) -> float:
-            # אפשר להגדיר כמינימום מרחק מהטופ/בוטם
-            if row["direction"] == "bull":
-                # אם המחיר מעל ה-FVG, נמדוד מהטופ; אחרת מהבוטם
-                ref = row["top"] if last_price >= row["top"] else row["bottom"]
-                return float(last_price - ref)
-            else:
-                ref = row["bottom"] if last_price <= row["bottom"] else row["top"]
-                return float(ref - last_price)
-
-        df["distance_to_price"] = df.apply(_distance, axis=1)
+        # אפשר להגדיר כמינימום מרחק מהטופ/בוטם
+        top = df["top"].to_numpy(dtype=np.float64)
+        bottom = df["bottom"].to_numpy(dtype=np.float64)
+
+        # Direction mask computed once and reused by both np.where branches;
+        # categorical directions compare int8 codes instead of strings
+        direction = df["direction"]
+        if isinstance(direction.dtype, pd.CategoricalDtype) and "bull" in direction.cat.categories:
+            bull_code = direction.cat.categories.get_loc("bull")
+            is_bull = direction.cat.codes.to_numpy() == bull_code
+        else:
+            is_bull = direction.to_numpy() == "bull"
+
+        # bull: אם המחיר מעל ה-FVG, נמדוד מהטופ; אחרת מהבוטם
+        bull_ref = np.where(last_price >= top, top, bottom)
+        # bear: אם המחיר מתחת ל-FVG, נמדוד מהבוטם; אחרת מהטופ
+        bear_ref = np.where(last_price <= bottom, bottom, top)
+
+        ref = np.where(is_bull, bull_ref, bear_ref)
+        df["distance_to_price"] = np.where(is_bull, last_price - ref, ref - last_price)
 
     return df
@@ -5,10 +5,15 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT))
 
+import numpy as np
 import pandas as pd
+from pandas.testing import assert_frame_equal
 
 from src.data_layer.fetch_raw_data import load_ohlcv_file
-from src.data_layer.resample_timeframes import resample_ohlcv
+from src.data_layer.resample_timeframes import (
+    resample_ohlcv,
+    resample_ohlcv_timeframes,
+)
 from src.data_layer.enrich_with_sessions_and_events import enrich_with_time_features
 
 
@@ -61,6 +66,45 @@ def main() -> None:
     print(df_enriched.head())
     print("Extra cols:", [c for c in df_enriched.columns if c not in ["open","high","low","close","volume"]])
 
+    # Session must not depend on the index resolution (s/ms/us/ns)
+    print("\n[*] Checking sessions on a millisecond index...")
+    df_ms = df_2m.set_axis(df_2m.index.as_unit("ms"))
+    sessions_ms = enrich_with_time_features(df_ms, tz="UTC")["session"]
+    assert (sessions_ms == "London").all(), sessions_ms.tolist()
+    assert sessions_ms.tolist() == df_enriched["session"].tolist()
+    print("Sessions:", sessions_ms.tolist())
+
+    # NaT timestamps must yield missing features, not made-up dates
+    print("\n[*] Checking features for a NaT timestamp...")
+    df_nat = df_2m.set_axis(df_2m.index.insert(1, pd.NaT)[:-1])
+    features = ["session", "day_of_week", "day_name", "week_of_month", "month", "month_name"]
+    nat_row = enrich_with_time_features(df_nat, tz="UTC")[features].iloc[1]
+    assert nat_row.isna().all(), nat_row.tolist()
+    print("NaT row:", nat_row.tolist())
+
+    # Cascaded multi-timeframe resampling must match resampling each rule
+    # directly, also across a DST change (where cascading is not used)
+    print("\n[*] Checking multi-timeframe resampling...")
+    rules = ["1min", "5min", "15min", "1h", "4h", "1D", "1W"]
+    rng = np.random.default_rng(0)
+    for tz in ("UTC", "America/New_York"):
+        times = pd.date_range("2024-03-01", "2024-03-20", freq="min", tz=tz)
+        closes = 18000 + np.cumsum(rng.normal(0, 2, len(times)))
+        df_1m = pd.DataFrame(
+            {
+                "open": closes,
+                "high": closes + 1,
+                "low": closes - 1,
+                "close": closes,
+                "volume": rng.integers(1, 100, len(times)),
+            },
+            index=times,
+        )
+        multi = resample_ohlcv_timeframes(df_1m, rules)
+        for rule in rules:
+            assert_frame_equal(multi[rule], resample_ohlcv(df_1m, rule))
+    print("Multi-timeframe resampling OK")
+
 
 if __name__ == "__main__":
     main()
@@ -1,13 +1,22 @@
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+from pandas.testing import assert_frame_equal
 
 # Add project root to sys.path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT))
 
-from src.known_patterns.fvg_detector import detect_fvg, fvgs_to_frame  # noqa: E402
+from src.known_patterns.fvg_detector import (  # noqa: E402
+    _scan_fvg,
+    _scan_fvg_numpy,
+    detect_fvg,
+    detect_fvg_for_timeframes,
+    detect_fvg_frame,
+    fvgs_to_frame,
+)
 
 
 def create_dummy_ohlcv() -> pd.DataFrame:
@@ -55,6 +64,56 @@ def main() -> None:
     else:
         print("[!] No FVG detected – check logic.")
 
+    # The columnar frame must match the FVG-object path, and an empty
+    # result must keep the same schema as a non-empty one
+    print("\n[*] Checking detect_fvg_frame schema...")
+    frame = detect_fvg_frame(df, tf="1m", min_width=0.5)
+    assert_frame_equal(frame, fvgs_to_frame(fvgs))
+    assert_frame_equal(detect_fvg_frame(df, tf="1m", min_width=1e9), frame.iloc[:0])
+    multi = detect_fvg_for_timeframes(df, ["1m"], min_width=0.5)
+    # No timeframes: same dtypes, the 'tf' categories just have no labels
+    assert_frame_equal(
+        detect_fvg_for_timeframes(df, []), multi.iloc[:0], check_categorical=False
+    )
+    print("Schema OK")
+
+    # An invalid bar (low > high) can open both gaps: bull first, then bear
+    print("\n[*] Checking a bar that opens both gaps...")
+    bad = pd.DataFrame(
+        {
+            "open": [99.0, 99.0, 100.0],
+            "high": [100.0, 100.0, 95.0],
+            "low": [98.0, 98.0, 105.0],
+            "close": [99.0, 99.0, 100.0],
+            "volume": [1, 1, 1],
+        },
+        index=pd.date_range("2024-01-01 09:30:00", periods=3, freq="min", tz="UTC"),
+    )
+    both = detect_fvg(bad, tf="1m")
+    assert [(f.direction, f.bottom, f.top) for f in both] == [
+        ("bull", 100.0, 105.0),
+        ("bear", 95.0, 98.0),
+    ], both
+    print("Both gaps kept:", [f.direction for f in both])
+
+    # The Numba kernel (when installed) must return exactly what the
+    # NumPy fallback returns, including bars with low > high that open
+    # both a bull and a bear gap
+    print("\n[*] Checking scan kernel parity...")
+    rng = np.random.default_rng(0)
+    closes = np.cumsum(rng.normal(0, 3, 5000))
+    highs = closes + rng.random(5000) * 2
+    lows = closes - rng.random(5000) * 2
+    swap = rng.random(5000) < 0.1
+    highs[swap], lows[swap] = lows[swap].copy(), highs[swap].copy()
+    for min_width in (0.0, 3.0):
+        kernel = _scan_fvg(highs, lows, min_width)
+        fallback = _scan_fvg_numpy(highs, lows, min_width)
+        for got, expected in zip(kernel, fallback):
+            assert got.dtype == expected.dtype
+            np.testing.assert_array_equal(got, expected)
+    print("Scan parity OK")
+
 
 if __name__ == "__main__":
     main()